@@ -0,0 +1,78 @@
+"""
+Numeric kernels used by Evaluator.validate.
+
+evaluate_kernel(base, curr) takes two float64 arrays and returns
+(delta, confidence, impact_tier_idx). Batches of at least JIT_MIN_BATCH
+hypotheses use a JIT-compiled native loop when numba is installed; all
+other batches use an equivalent NumPy implementation. numba is imported
+only on the first large batch, so normal runs never pay its import and
+compile cost.
+"""
+import numpy as np
+
+# |delta| above MEDIUM_IMPACT_DELTA is "medium" impact, above HIGH_IMPACT_DELTA is "high"
+MEDIUM_IMPACT_DELTA = 0.15
+HIGH_IMPACT_DELTA = 0.3
+
+# Below this many hypotheses the NumPy path is faster than loading numba
+JIT_MIN_BATCH = 5_000
+
+# Compiled _evaluate_loop; None until first requested, False if numba is missing
+_jit_kernel = None
+
+
+def _evaluate_numpy(base, curr):
+    """Vectorized version: relative delta (0 where baseline is 0), confidence, tier."""
+    with np.errstate(invalid="ignore"):
+        delta = np.divide(curr - base, base, out=np.zeros_like(base), where=base != 0)
+    abs_delta = np.abs(delta)
+    confidence = np.minimum(abs_delta * 2, 1.0)
+    # Strict comparisons: exactly 0.3 is "medium", and NaN is "low" as in the loop
+    tier = np.where(
+        abs_delta > HIGH_IMPACT_DELTA,
+        2,
+        np.where(abs_delta > MEDIUM_IMPACT_DELTA, 1, 0),
+    )
+    return delta, confidence, tier
+
+
+def _evaluate_loop(base, curr):
+    """Scalar loop version of _evaluate_numpy, written for numba to compile."""
+    n = base.size
+    delta = np.empty(n)
+    confidence = np.empty(n)
+    tier = np.empty(n, np.int64)
+    for i in range(n):
+        d = 0.0 if base[i] == 0 else (curr[i] - base[i]) / base[i]
+        a = abs(d)
+        delta[i] = d
+        confidence[i] = min(a * 2, 1.0)
+        if a > HIGH_IMPACT_DELTA:
+            tier[i] = 2
+        elif a > MEDIUM_IMPACT_DELTA:
+            tier[i] = 1
+        else:
+            tier[i] = 0
+    return delta, confidence, tier
+
+
+def _get_jit_kernel():
+    """Compile (or load from numba's cache) _evaluate_loop on first use."""
+    global _jit_kernel
+    if _jit_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            _jit_kernel = False
+        else:
+            _jit_kernel = njit(cache=True)(_evaluate_loop)
+    return _jit_kernel or None
+
+
+def evaluate_kernel(base, curr):
+    """Score a batch, using the numba kernel only for large batches."""
+    if base.size >= JIT_MIN_BATCH:
+        jit_kernel = _get_jit_kernel()
+        if jit_kernel is not None:
+            return jit_kernel(base, curr)
+    return _evaluate_numpy(base, curr)
@@ -1,6 +1,36 @@
-import random
 import re
 
+import numpy as np
+
+HEADLINE_TEMPLATES = (
+    "New styles from {} — Don’t Miss Out!",
+    "{}: Trending Now!",
+    "Upgrade Your Look with {}",
+)
+CTA_OPTIONS = ("Shop Now", "Buy Today", "Learn More", "Limited Offer")
+BODY_TEMPLATE = "Discover premium comfort and style. {}. Order now for fast delivery!"
+EMPTY_VOCAB_BODY = "Discover premium comfort and style. Shop now for exclusive offers!"
+
+# Word tokens of 3+ characters; the length filter runs inside the regex engine
+_VOCAB_RE = re.compile(r"\w{3,}")
+
+
+def _sample_rows(rng, n_rows, population, k):
+    """
+    Draw k distinct integers from range(population) for each of n_rows rows,
+    in random order. Uses Floyd's algorithm vectorized across rows, so the
+    work and memory are O(n_rows * k) regardless of the population size.
+    """
+    picks = np.empty((n_rows, k), dtype=np.int64)
+    for step, j in enumerate(range(population - k, population)):
+        t = rng.integers(0, j + 1, size=n_rows)
+        # Already picked in this row: take j instead (it cannot have been drawn yet)
+        taken = (picks[:, :step] == t[:, None]).any(axis=1)
+        picks[:, step] = np.where(taken, j, t)
+    # Floyd picks a uniform subset; shuffle within each row for a uniform order
+    return rng.permuted(picks, axis=1)
+
+
 class CreativeGenerator:
     """
     Creative Generator Agent:
@@ -10,7 +40,7 @@ class CreativeGenerator:
 
     def __init__(self, cfg):
         self.cfg = cfg
-        random.seed(self.cfg.get("random_seed", 42))
+        self.rng = np.random.default_rng(self.cfg.get("random_seed", 42))
 
     def generate(self, summary):
         """
@@ -27,27 +57,42 @@ class CreativeGenerator:
             }
         """
         low_campaigns = summary.get("low_ctr_campaigns", [])
+        if not low_campaigns:
+            return []
+
         campaign_data = summary.get("campaign", [])
         outputs = []
 
-        # Build a simple vocabulary from campaign names
-        vocab = set()
-        for c in campaign_data:
-            name = c.get("campaign_name", "") or ""
-            tokens = re.findall(r"\w+", name.lower())
-            for t in tokens:
-                if len(t) > 2:
-                    vocab.add(t)
-        vocab = list(vocab)
-
-        for c in low_campaigns:
+        # Build a simple vocabulary from campaign names in one regex pass.
+        # "\n" is not a word character, so no token spans two names.
+        names = "\n".join([c.get("campaign_name", "") or "" for c in campaign_data])
+        # dict.fromkeys dedupes in first-seen order, so a seed reproduces
+        # the same words across processes (set order depends on hashing).
+        vocab = tuple(dict.fromkeys(_VOCAB_RE.findall(names.lower())))
+
+        # Draw every random choice for all campaigns up front (3 ideas each)
+        n = len(low_campaigns)
+        headline_idx = self.rng.integers(0, len(HEADLINE_TEMPLATES), size=(n, 3)).tolist()
+        cta_idx = self.rng.integers(0, len(CTA_OPTIONS), size=(n, 3)).tolist()
+        k = min(5, len(vocab))
+        if k:
+            # k distinct vocab positions per idea; row i * 3 + j is idea j of
+            # campaign i. The index lists are dropped once the bodies exist.
+            bodies = [
+                BODY_TEMPLATE.format(" ".join([vocab[w] for w in words]))
+                for words in _sample_rows(self.rng, n * 3, len(vocab), k).tolist()
+            ]
+        else:
+            bodies = [EMPTY_VOCAB_BODY] * (n * 3)
+
+        for i, c in enumerate(low_campaigns):
             campaign_name = c.get("campaign_name", "Unknown")
             suggestions = []
 
-            for _ in range(3):  # generate 3 creative ideas
-                headline = self._generate_headline(campaign_name)
-                body = self._generate_body(vocab)
-                cta = random.choice(["Shop Now", "Buy Today", "Learn More", "Limited Offer"])
+            for j in range(3):  # generate 3 creative ideas
+                headline = self._generate_headline(campaign_name, headline_idx[i][j])
+                body = bodies[i * 3 + j]
+                cta = CTA_OPTIONS[cta_idx[i][j]]
 
                 suggestions.append({
                     "headline": headline,
@@ -62,20 +107,6 @@ class CreativeGenerator:
 
         return outputs
 
-    def _generate_headline(self, campaign_name):
+    def _generate_headline(self, campaign_name, template_idx):
         """Simple headline templates"""
-        templates = [
-            f"New styles from {campaign_name} — Don’t Miss Out!",
-            f"{campaign_name}: Trending Now!",
-            f"Upgrade Your Look with {campaign_name}"
-        ]
-        return random.choice(templates)
-
-    def _generate_body(self, vocab):
-        """Generate short descriptive text using random vocab tokens"""
-        if vocab:
-            words = random.sample(vocab, min(5, len(vocab)))
-            phrase = " ".join(words)
-            return f"Discover premium comfort and style. {phrase}. Order now for fast delivery!"
-        else:
-            return "Discover premium comfort and style. Shop now for exclusive offers!"
+        return HEADLINE_TEMPLATES[template_idx].format(campaign_name)
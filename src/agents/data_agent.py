@@ -1,14 +1,28 @@
 from dataclasses import dataclass
 import logging
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Tuple
 
 import numpy as np
 import pandas as pd
 
-from src.utils.loader import load_csv, EXPECTED_COLUMNS
+from src.utils.loader import load_csv, run_with_retries, validate_schema, EXPECTED_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+# Metric columns are typed by the CSV parser so no coercion pass is needed.
+METRIC_DTYPES: Dict[str, str] = {
+    "spend": "float64",
+    "impressions": "float64",
+    "clicks": "float64",
+    "revenue": "float64",
+}
+METRIC_COLUMNS = list(METRIC_DTYPES)
+
+# Files larger than this are summarised chunk by chunk (see _summarize_streaming)
+STREAMING_THRESHOLD_BYTES = 500_000_000
+STREAMING_CHUNK_ROWS = 500_000
+
 
 @dataclass
 class DataAgent:
@@ -33,14 +47,23 @@ class DataAgent:
         path = self.cfg["data_csv"]
         logger.info("DataAgent: loading dataset from %s", path)
 
-        # Use the same keyword name as in loader.load_csv
-        df = load_csv(path, required_columns=EXPECTED_COLUMNS)
+        # Use the same keyword name as in loader.load_csv.
+        # The file is read once per run, so skip the cache (and its copy).
+        df = load_csv(
+            path,
+            required_columns=EXPECTED_COLUMNS,
+            dtype_map=METRIC_DTYPES,
+            use_cache=False,
+        )
 
-        # Basic cleaning: handle inf / NaN in numeric columns
-        numeric_cols = [col for col in df.columns if df[col].dtype.kind in "if"]
+        # Basic cleaning: handle inf / NaN in numeric columns.
+        # Integer columns cannot hold inf / NaN, so only float columns need it.
+        numeric_cols = df.select_dtypes(include="floating").columns.tolist()
         if numeric_cols:
-            df[numeric_cols] = df[numeric_cols].replace([np.inf, -np.inf], np.nan)
-            df[numeric_cols] = df[numeric_cols].fillna(0.0)
+            # One pass over a single float block instead of replace() + fillna()
+            block = df[numeric_cols].to_numpy(dtype=np.float64)
+            np.nan_to_num(block, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+            df[numeric_cols] = block
 
         if df.empty:
             logger.error("DataAgent: dataset is empty after cleaning")
@@ -53,6 +76,45 @@ class DataAgent:
         )
         return df
 
+    def _summarize_streaming(self, path: str) -> Tuple[np.ndarray, int, int]:
+        """
+        Reduce the metric totals chunk by chunk without materialising the
+        whole dataset, so peak memory is one chunk rather than the full file.
+
+        Same error contract as load_csv: transient I/O errors are retried,
+        schema / parse / empty-data errors raise DataLoaderError.
+
+        Returns:
+            (metric sums in METRIC_COLUMNS order, row count, column count)
+        """
+        logger.info("DataAgent: streaming dataset from %s", path)
+
+        def reduce_chunks() -> Tuple[np.ndarray, int, int]:
+            header = pd.read_csv(path, nrows=0)
+            validate_schema(header, EXPECTED_COLUMNS)
+
+            sums = np.zeros(len(METRIC_COLUMNS))
+            rows = 0
+            chunks = pd.read_csv(
+                path,
+                usecols=METRIC_COLUMNS,
+                dtype=METRIC_DTYPES,
+                chunksize=self.cfg.get("streaming_chunk_rows", STREAMING_CHUNK_ROWS),
+            )
+            for chunk in chunks:
+                block = chunk[METRIC_COLUMNS].to_numpy(dtype=np.float64)
+                np.nan_to_num(block, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+                sums += np.add.reduce(block, axis=0)
+                rows += len(chunk)
+
+            if rows == 0:
+                logger.error("DataAgent: dataset is empty after cleaning")
+                raise ValueError("Dataset is empty after cleaning")
+
+            return sums, rows, len(header.columns)
+
+        return run_with_retries(reduce_chunks, path)
+
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
@@ -63,15 +125,22 @@ class DataAgent:
         Returns:
             Dictionary with:
             - totals: aggregate metrics (spend, impressions, clicks, revenue, ctr, roas)
-            - overall: same metrics again (for convenience / tests)
+            - overall: the totals dict again (for convenience / tests)
             - shape: rows / cols
         """
-        df = self._load_raw()
+        path = self.cfg["data_csv"]
+        threshold = self.cfg.get("streaming_threshold_bytes", STREAMING_THRESHOLD_BYTES)
+
+        if os.path.getsize(path) > threshold:
+            sums, n_rows, n_cols = self._summarize_streaming(path)
+        else:
+            df = self._load_raw()
+            # One fused reduction over the metric block instead of four Series.sum()
+            block = df[METRIC_COLUMNS].to_numpy(dtype=np.float64)
+            sums = np.add.reduce(block, axis=0)
+            n_rows, n_cols = df.shape
 
-        total_spend = float(df["spend"].sum())
-        total_impressions = float(df["impressions"].sum())
-        total_clicks = float(df["clicks"].sum())
-        total_revenue = float(df["revenue"].sum())
+        total_spend, total_impressions, total_clicks, total_revenue = map(float, sums)
 
         ctr = (total_clicks / total_impressions) if total_impressions > 0 else 0.0
         roas = (total_revenue / total_spend) if total_spend > 0 else 0.0
@@ -85,15 +154,15 @@ class DataAgent:
             "roas": roas,
         }
 
-        # Tests expect summary["overall"] – we mirror totals there
-        overall: Dict[str, Any] = dict(totals)
+        # Tests expect summary["overall"] – it is the same dict as totals
+        overall = totals
 
         summary: Dict[str, Any] = {
             "totals": totals,
             "overall": overall,
             "shape": {
-                "rows": int(df.shape[0]),
-                "cols": int(df.shape[1]),
+                "rows": int(n_rows),
+                "cols": int(n_cols),
             },
         }
 
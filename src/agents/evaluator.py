@@ -1,8 +1,14 @@
 import logging
 from typing import Dict, List
 
+import numpy as np
+
+from src.agents._eval_kernels import evaluate_kernel
+
 logger = logging.getLogger(__name__)
 
+IMPACT_TIERS = np.array(["low", "medium", "high"])
+
 
 class Evaluator:
     """
@@ -13,9 +19,18 @@ class Evaluator:
     - zero-crash guarantee
     """
 
+    def __init__(self, cfg):
+        self.cfg = cfg
+
     def validate(self, hypotheses: List[Dict], summary: Dict) -> List[Dict]:
         results = []
 
+        # Hypotheses that resolved to numeric baseline/current values are
+        # scored together below; their slot in `results` is filled afterwards.
+        pending = []
+        baselines = []
+        currents = []
+
         for h in hypotheses:
             try:
                 metric = h.get("metric", "unknown")
@@ -38,39 +53,13 @@ class Evaluator:
                     else:
                         baseline_val = 0
 
-                # ✅ SAFE DELTA CALCULATION
-                if baseline_val == 0:
-                    delta = 0
-                else:
-                    delta = (current_val - baseline_val) / baseline_val
+                baseline_val = float(baseline_val)
+                current_val = float(current_val)
 
-                confidence = round(min(abs(delta) * 2, 1.0), 2)
-
-                impact = "low"
-                if abs(delta) > 0.3:
-                    impact = "high"
-                elif abs(delta) > 0.15:
-                    impact = "medium"
-
-                evaluated = {
-                    "hypothesis": h.get("hypothesis", "unknown"),
-                    "metric": metric,
-                    "baseline": round(baseline_val, 4),
-                    "current": round(current_val, 4),
-                    "delta_pct": round(delta * 100, 2),
-                    "impact": impact,
-                    "confidence": confidence,
-                }
-
-                logger.info(
-                    "Evaluated hypothesis: %s | delta=%.2f%% | impact=%s | confidence=%.2f",
-                    evaluated["hypothesis"],
-                    evaluated["delta_pct"],
-                    evaluated["impact"],
-                    evaluated["confidence"],
-                )
-
-                results.append(evaluated)
+                pending.append((len(results), h, metric))
+                baselines.append(baseline_val)
+                currents.append(current_val)
+                results.append(None)
 
             except Exception as e:
                 logger.exception("Evaluator failed on hypothesis: %s", h)
@@ -81,4 +70,41 @@ class Evaluator:
                     "confidence": 0.0,
                 })
 
+        if not pending:
+            return results
+
+        # ✅ SAFE DELTA CALCULATION (whole batch at once, 0 where baseline is 0)
+        base = np.array(baselines, dtype=np.float64)
+        curr = np.array(currents, dtype=np.float64)
+        delta, confidence, tier = evaluate_kernel(base, curr)
+
+        columns = zip(
+            np.round(base, 4).tolist(),
+            np.round(curr, 4).tolist(),
+            np.round(delta * 100, 2).tolist(),
+            IMPACT_TIERS[tier].tolist(),
+            np.round(confidence, 2).tolist(),
+        )
+        for (pos, h, metric), (baseline, current, delta_pct, impact, conf) in zip(pending, columns):
+            results[pos] = {
+                "hypothesis": h.get("hypothesis", "unknown"),
+                "metric": metric,
+                "baseline": baseline,
+                "current": current,
+                "delta_pct": delta_pct,
+                "impact": impact,
+                "confidence": conf,
+            }
+
+        # One log record for the whole batch instead of one per hypothesis
+        if logger.isEnabledFor(logging.INFO):
+            log_rows = [
+                "  %s | delta=%.2f%% | impact=%s | confidence=%.2f"
+                % (r["hypothesis"], r["delta_pct"], r["impact"], r["confidence"])
+                for r in (results[pos] for pos, _, _ in pending)
+            ]
+            logger.info(
+                "Evaluated %d hypotheses:\n%s", len(log_rows), "\n".join(log_rows)
+            )
+
         return results
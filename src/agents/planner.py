@@ -4,6 +4,9 @@ class Planner:
     Breaks the user query into structured subtasks for other agents.
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("cfg",)
+
     def __init__(self, cfg):
         self.cfg = cfg
 
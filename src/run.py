@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import os
-import json
 import argparse
 import logging
 import yaml
@@ -11,6 +10,7 @@ from src.agents.insight_agent import InsightAgent
 from src.agents.evaluator import Evaluator
 from src.agents.creative_generator import CreativeGenerator
 from src.utils.logging_config import setup_logging  # NEW IMPORT
+from src.utils.serialization import to_json_bytes
 
 CONFIG_PATH = "config/config.yaml"
 
@@ -93,14 +93,14 @@ def main() -> None:
     os.makedirs("reports", exist_ok=True)
     logger.info("Saving outputs into reports/ directory")
 
-    with open("reports/insights.json", "w", encoding="utf-8") as f:
-        json.dump(hypotheses, f, indent=2, ensure_ascii=False)
+    with open("reports/insights.json", "wb") as f:
+        f.write(to_json_bytes(hypotheses, indent=True))
 
-    with open("reports/validations.json", "w", encoding="utf-8") as f:
-        json.dump(validations, f, indent=2, ensure_ascii=False)
+    with open("reports/validations.json", "wb") as f:
+        f.write(to_json_bytes(validations, indent=True))
 
-    with open("reports/creatives.json", "w", encoding="utf-8") as f:
-        json.dump(creatives, f, indent=2, ensure_ascii=False)
+    with open("reports/creatives.json", "wb") as f:
+        f.write(to_json_bytes(creatives, indent=True))
 
     # Create report.md
     report_lines: list[str] = []
@@ -1,10 +1,20 @@
+import asyncio
+import functools
+import importlib.util
 import logging
-from typing import List, Optional
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple, TypeVar
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class DataLoaderError(Exception):
     """Custom exception for CSV loading failures."""
@@ -19,6 +29,31 @@ EXPECTED_COLUMNS: List[str] = [
     "clicks",
     "revenue",
 ]
+EXPECTED_COLUMNS_SET = frozenset(EXPECTED_COLUMNS)
+
+# Retry policy for transient I/O errors (exponential backoff with jitter)
+MAX_LOAD_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.5
+# OSErrors that are not transient: raised at once instead of retried
+PERMANENT_IO_ERRORS = (IsADirectoryError, NotADirectoryError, PermissionError)
+
+# Narrowest type _compact_dtypes downcasts count columns to
+MIN_COUNT_DTYPE = np.dtype("int32")
+
+# Date formats tried (in order) against the first non-null date value
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y")
+
+# pyarrow is optional: when installed it is the default CSV engine.
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Column types handed to pyarrow's CSV reader. Count columns are left to
+# type inference, like pandas does: they may be written as floats ("4313.0")
+# and _compact_dtypes downcasts them afterwards. Dates are converted after
+# loading (see _parse_dates).
+ARROW_COLUMN_TYPES = {
+    "spend": "float64",
+    "revenue": "float64",
+}
 
 
 def validate_schema(
@@ -33,9 +68,14 @@ def validate_schema(
     """
     if expected_columns is None:
         expected_columns = EXPECTED_COLUMNS
+        expected_set = EXPECTED_COLUMNS_SET
+    else:
+        expected_set = frozenset(expected_columns)
 
-    missing = [col for col in expected_columns if col not in df.columns]
-    extra = [col for col in df.columns if col not in expected_columns]
+    # Hash lookups instead of scanning one column list per column
+    df_columns = set(df.columns)
+    missing = [col for col in expected_columns if col not in df_columns]
+    extra = [col for col in df.columns if col not in expected_set]
 
     if missing:
         logger.error("Schema validation failed. Missing columns: %s", missing)
@@ -48,29 +88,252 @@ def validate_schema(
     logger.info("Schema validation passed. All required columns are present.")
 
 
+def _read_csv_pyarrow(
+    path: str,
+    dtype_map: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Parse a CSV with pyarrow's multi-threaded reader and hand the Arrow
+    buffers over to pandas.
+
+    dtype_map means the same as pd.read_csv's dtype: NumPy bool / int /
+    float types are applied by the Arrow reader, anything else (nullable
+    "Int64", "string", "category", ...) with astype after conversion.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    column_types = dict(ARROW_COLUMN_TYPES)
+    post_types = {}
+    for col, dtype_name in (dtype_map or {}).items():
+        dtype = pd.api.types.pandas_dtype(dtype_name)
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            # Canonical NumPy name, e.g. "float" -> "float64" (Arrow reads
+            # "float" as float32)
+            column_types[col] = dtype.name
+        else:
+            column_types.pop(col, None)
+            post_types[col] = dtype
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                col: pa.type_for_alias(alias)
+                for col, alias in column_types.items()
+            },
+            # Empty text cells are missing values, as with pd.read_csv
+            strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    if post_types:
+        df = df.astype(post_types)
+    return df
+
+
+def _parse_dates(df: pd.DataFrame) -> None:
+    """
+    Convert the date column in place using one explicit format, probed from
+    the first non-null value, so pandas takes its fast fixed-format path
+    instead of inferring per value. Unparseable dates become NaT, with a
+    warning giving their count.
+    """
+    if "date" not in df.columns or df["date"].dtype.kind == "M":
+        return
+
+    first_idx = df["date"].first_valid_index()
+    date_format = None
+    if first_idx is not None:
+        sample = str(df["date"].at[first_idx])
+        for candidate in DATE_FORMATS:
+            try:
+                datetime.strptime(sample, candidate)
+            except ValueError:
+                continue
+            date_format = candidate
+            break
+
+    missing_before = int(df["date"].isna().sum())
+    df["date"] = pd.to_datetime(
+        df["date"], format=date_format, cache=True, errors="coerce"
+    )
+
+    # Values in another format (or garbage) are coerced; make the loss visible
+    coerced = int(df["date"].isna().sum()) - missing_before
+    if coerced:
+        logger.warning(
+            "%d date value(s) did not match format %s and were set to NaT",
+            coerced,
+            date_format,
+        )
+
+
+def _compact_dtypes(df: pd.DataFrame, keep: Collection[str] = ()) -> None:
+    """
+    Shrink the dataframe in place: campaign_name becomes categorical and
+    the impressions / clicks counts are downcast to a signed integer type,
+    no narrower than int32 so differences and scaled values do not wrap.
+    Columns in `keep` are left untouched.
+    """
+    if "campaign_name" in df.columns and "campaign_name" not in keep:
+        df["campaign_name"] = df["campaign_name"].astype("category")
+
+    for col in ("impressions", "clicks"):
+        if col in df.columns and col not in keep and df[col].dtype.kind in "iuf":
+            values = pd.to_numeric(df[col], downcast="integer")
+            if values.dtype.kind == "i" and values.dtype.itemsize < MIN_COUNT_DTYPE.itemsize:
+                values = values.astype(MIN_COUNT_DTYPE)
+            df[col] = values
+
+
 def load_csv(
     path: str,
     required_columns: Optional[List[str]] = None,
+    engine: Optional[str] = None,
+    dtype_map: Optional[Dict[str, str]] = None,
+    compact_dtypes: bool = True,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """
     Load a CSV with retries + schema validation.
 
+    With use_cache, parsed frames are cached per (path, inode, size,
+    modification time, options), so repeated loads of an unchanged file skip parsing and
+    validation. Each call returns its own copy, so callers may modify it
+    freely. The cost is memory: up to 8 parsed frames stay alive for the
+    life of the process, and each call holds a second full copy. Callers
+    that load a file once should pass use_cache=False.
+
     Args:
         path: Path to CSV file.
         expected_columns: Optional explicit schema to validate.
+        engine: "pyarrow" for the multi-threaded Arrow CSV reader or
+            "pandas" for pd.read_csv. Defaults to "pyarrow" when it is
+            installed, otherwise "pandas".
+        dtype_map: Optional column -> pandas dtype name (e.g. "float64",
+            "Int64", "string"), with the same result on both engines.
+            NumPy numeric types are applied by the CSV parser itself, so no
+            coercion pass is needed later.
+        compact_dtypes: Store campaign_name as a categorical and downcast
+            integer count columns (columns in dtype_map are kept as given).
+        use_cache: Reuse / keep the parsed frame in the process-wide cache.
+            When False the file is always parsed and the frame is returned
+            without a copy.
 
     Returns:
         Pandas DataFrame.
 
     Raises:
         FileNotFoundError: if the file does not exist.
-        ValueError: if schema validation fails.
-        DataLoaderError: for repeated unexpected errors.
+        IsADirectoryError, NotADirectoryError, PermissionError: raised
+            immediately, without retries.
+        DataLoaderError: on parse / schema errors (raised immediately) or
+            when a transient I/O error persists across all retries.
     """
     if required_columns is None:
         required_columns = EXPECTED_COLUMNS
 
-    max_attempts = 3
+    if engine is None:
+        engine = "pyarrow" if HAS_PYARROW else "pandas"
+    if engine not in ("pandas", "pyarrow"):
+        raise ValueError(f"Unsupported CSV engine: {engine!r}")
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        logger.error("Data file not found at path: %s", path)
+        raise
+
+    args = (
+        str(path),
+        (stat.st_ino, stat.st_size, stat.st_mtime_ns),
+        tuple(required_columns),
+        engine,
+        tuple(sorted((dtype_map or {}).items())),
+        compact_dtypes,
+    )
+    if not use_cache:
+        return _load_csv_cached.__wrapped__(*args)
+
+    # Deep copy: in-place writes by the caller must not reach the cached frame
+    return _load_csv_cached(*args).copy()
+
+
+async def load_csv_async(path: str, **kwargs: Any) -> pd.DataFrame:
+    """
+    Run load_csv (same arguments, retries and caching) in a worker thread,
+    so the event loop is not blocked by file I/O, parsing or retry sleeps.
+    """
+    return await asyncio.to_thread(load_csv, path, **kwargs)
+
+
+async def load_csvs_async(paths: Iterable[str], **kwargs: Any) -> List[pd.DataFrame]:
+    """
+    Load several CSVs concurrently (one worker thread each) and return the
+    frames in the order of `paths`. The pandas and pyarrow parsers release
+    the GIL, so the reads overlap. The first failure is raised.
+    """
+    return list(
+        await asyncio.gather(*(load_csv_async(path, **kwargs) for path in paths))
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_csv_cached(
+    path: str,
+    file_id: Tuple[int, int, int],
+    required_columns: Tuple[str, ...],
+    engine: str,
+    dtype_items: Tuple[Tuple[str, str], ...],
+    compact_dtypes: bool,
+) -> pd.DataFrame:
+    """
+    Read, validate and compact the CSV (see load_csv). file_id (inode,
+    size, modification time) is only part of the cache key, so a rewritten
+    or replaced file is parsed again even if its mtime was preserved.
+    """
+    dtype_map = dict(dtype_items) or None
+
+    def read() -> pd.DataFrame:
+        # Fail fast on schema drift: check the header before parsing rows
+        validate_schema(pd.read_csv(path, nrows=0), list(required_columns))
+
+        if engine == "pyarrow":
+            df = _read_csv_pyarrow(path, dtype_map)
+        else:
+            df = pd.read_csv(path, dtype=dtype_map)
+        logger.info(
+            "CSV loaded successfully: %d rows x %d columns",
+            df.shape[0],
+            df.shape[1],
+        )
+
+        _parse_dates(df)
+
+        if df.empty:
+            logger.error("Loaded CSV is empty after reading: %s", path)
+            raise ValueError("Dataset is empty after loading")
+
+        if compact_dtypes:
+            _compact_dtypes(df, keep=dtype_map or ())
+
+        return df
+
+    return run_with_retries(read, path)
+
+
+def run_with_retries(read: Callable[[], T], path: str) -> T:
+    """
+    Run read() (which loads `path`) with the loader's error contract:
+
+    - FileNotFoundError and PERMANENT_IO_ERRORS are re-raised immediately.
+    - Other OSErrors are treated as transient and retried with exponential
+      backoff and jitter, up to MAX_LOAD_ATTEMPTS attempts.
+    - Any other error (parse / schema / empty data) is raised at once as
+      DataLoaderError.
+    """
+    max_attempts = MAX_LOAD_ATTEMPTS
     last_error: Optional[Exception] = None
 
     for attempt in range(1, max_attempts + 1):
@@ -81,33 +344,38 @@ def load_csv(
                 attempt,
                 max_attempts,
             )
-            df = pd.read_csv(path, parse_dates=["date"], infer_datetime_format=True)
-            logger.info(
-                "CSV loaded successfully: %d rows x %d columns",
-                df.shape[0],
-                df.shape[1],
-            )
-
-            validate_schema(df, required_columns)
-
-            if df.empty:
-                logger.error("Loaded CSV is empty after reading: %s", path)
-                raise ValueError("Dataset is empty after loading")
-
-            return df
+            return read()
 
         except FileNotFoundError:
             # No point retrying if the file itself is missing
             logger.error("Data file not found at path: %s", path)
             raise
 
-        except Exception as exc:  # noqa: BLE001
+        except PERMANENT_IO_ERRORS as exc:
+            # Wrong path type / permissions: retrying cannot help
+            logger.error("Cannot read data file at path %s: %s", path, exc)
+            raise
+
+        except OSError as exc:
+            # Transient I/O failure (e.g. a flaky mount): back off and retry
             last_error = exc
+            logger.warning(
+                "I/O error while loading CSV (attempt %d/%d): %s",
+                attempt,
+                max_attempts,
+                exc,
+            )
+            if attempt < max_attempts:
+                delay = RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+                time.sleep(delay + random.uniform(0, delay))
+
+        except Exception as exc:  # noqa: BLE001
+            # Parse / schema / empty-data errors will not fix themselves
             logger.exception(
                 "Unexpected error while loading CSV (attempt %d)", attempt
             )
             # Wrap in our custom error so callers & tests can assert on it.
-            raise DataLoaderError(f"CSV loading failed: {exc}")
+            raise DataLoaderError(f"CSV loading failed: {exc}") from exc
 
     # If we reach here, all attempts failed.
     assert last_error is not None
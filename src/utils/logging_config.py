@@ -1,43 +1,97 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+# Log files rotate at this size, keeping this many old files
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Background thread that owns the real handlers (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging() -> Path:
     """
     Configure logging to write both to console and to a timestamped log file.
 
+    Loggers only enqueue records; formatting and the file / console writes
+    happen on a background QueueListener thread, so log calls in hot paths
+    do not block on I/O.
+
     Returns
     -------
     Path
-        Path to the log file created for this run.
+        Path to this run's log file (created when the first record is written).
     """
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # UTC, like the per-line timestamps below
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     log_path = logs_dir / f"run_{timestamp}.log"
 
+    # Short UTC timestamps (the UTC date is in the file name): strftime on
+    # a gmtime struct, no msec suffix and no local-timezone lookup per record.
     formatter = logging.Formatter(
-        "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+        "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+        datefmt="%H:%M:%SZ",
     )
+    formatter.converter = time.gmtime
 
-    # File handler
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    # File handler: size-capped, and the file is only created on first write
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.INFO)
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    # Console handler: short format, the log file keeps the full one
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
     console_handler.setLevel(logging.INFO)
 
+    # Skip per-record caller / thread / process lookups; the format above
+    # does not use them.
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Both handlers are driven by one background listener thread
+    global _listener
+    _stop_listener()
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+
     # Root logger config
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
     root_logger.handlers.clear()  # avoid duplicate logs
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     # Silence very noisy libraries if needed
     logging.getLogger("matplotlib").setLevel(logging.WARNING)
@@ -0,0 +1,52 @@
+import json
+import math
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _to_plain(obj: Any) -> Any:
+    """
+    Prepare obj for the stdlib json module the way orjson encodes it:
+    NumPy values become Python values, tuples become lists and non-finite
+    floats (NaN / inf, which json would write as invalid JSON) become None.
+    """
+    if isinstance(obj, float):
+        return float(obj) if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _to_plain(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _to_plain(obj.item())
+    return obj
+
+
+def to_json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Uses orjson (C encoder with native NumPy support) when installed and
+    falls back to the standard library json module otherwise. Both give
+    the same JSON: NaN / inf are written as null and non-str dict keys
+    (e.g. ints) are converted to strings.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(
+        _to_plain(obj),
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode("utf-8")
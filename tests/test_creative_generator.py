@@ -0,0 +1,74 @@
+from src.agents.creative_generator import (
+    BODY_TEMPLATE,
+    EMPTY_VOCAB_BODY,
+    CreativeGenerator,
+)
+
+
+def _summary(names):
+    campaigns = [{"campaign_name": name} for name in names]
+    return {"campaign": campaigns, "low_ctr_campaigns": campaigns}
+
+
+def _body_words(body):
+    """The vocabulary words inserted into a body built from BODY_TEMPLATE."""
+    prefix, suffix = BODY_TEMPLATE.split("{}")
+    assert body.startswith(prefix) and body.endswith(suffix)
+    return body[len(prefix):-len(suffix)].split(" ")
+
+
+def test_generate_is_reproducible_for_a_seed():
+    """The same random_seed gives identical suggestions."""
+    summary = _summary([
+        "Men Running Shoes Summer",
+        "Women Yoga Pants Instagram",
+        "Kids Sneakers Facebook Sale",
+    ])
+
+    first = CreativeGenerator({"random_seed": 7}).generate(summary)
+    second = CreativeGenerator({"random_seed": 7}).generate(summary)
+
+    assert first == second
+    assert [o["campaign_name"] for o in first] == [
+        "Men Running Shoes Summer",
+        "Women Yoga Pants Instagram",
+        "Kids Sneakers Facebook Sale",
+    ]
+    assert all(len(o["creative_suggestions"]) == 3 for o in first)
+
+
+def test_generate_bodies_use_distinct_vocab_words():
+    """Each body holds 5 distinct words (or every word, if fewer exist)."""
+    summary = _summary(["Men Running Shoes Summer", "Women Yoga Pants Instagram"])
+    vocab = {"men", "running", "shoes", "summer", "women", "yoga", "pants", "instagram"}
+
+    outputs = CreativeGenerator({"random_seed": 1}).generate(summary)
+    for output in outputs:
+        for idea in output["creative_suggestions"]:
+            words = _body_words(idea["body"])
+            assert len(words) == 5
+            assert len(set(words)) == 5
+            assert set(words) <= vocab
+
+    small = CreativeGenerator({}).generate(_summary(["Red Shoes"]))
+    for idea in small[0]["creative_suggestions"]:
+        assert sorted(_body_words(idea["body"])) == ["red", "shoes"]
+
+
+def test_generate_falls_back_when_vocab_is_empty():
+    """Names without 3+ character words produce the fixed fallback body."""
+    outputs = CreativeGenerator({}).generate(_summary(["A1", "B"]))
+
+    assert len(outputs) == 2
+    for output in outputs:
+        assert [idea["body"] for idea in output["creative_suggestions"]] == [
+            EMPTY_VOCAB_BODY
+        ] * 3
+
+
+def test_generate_without_low_ctr_campaigns_returns_empty_list():
+    """Nothing to suggest when no campaign is flagged as low CTR."""
+    summary = {"campaign": [{"campaign_name": "Men Running Shoes"}]}
+
+    assert CreativeGenerator({}).generate(summary) == []
+    assert CreativeGenerator({}).generate({**summary, "low_ctr_campaigns": []}) == []
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from src.agents.data_agent import DataAgent
+from src.utils.loader import DataLoaderError
 
 
 def test_data_agent_summary_basic_metrics(tmp_path):
@@ -43,3 +44,70 @@ def test_data_agent_summary_basic_metrics(tmp_path):
     # ROAS = revenue / spend
     expected_roas = 110.0 / 30.0
     assert overall["roas"] == pytest.approx(expected_roas)
+
+
+def test_data_agent_streaming_summary_matches_in_memory(tmp_path):
+    """
+    Above the size threshold DataAgent reduces the CSV chunk by chunk;
+    the resulting summary must match the in-memory path.
+    """
+    csv_path = tmp_path / "sample_fb_ads_stream.csv"
+
+    df = pd.DataFrame(
+        {
+            "date": ["2025-01-01", "2025-01-02", "2025-01-03"],
+            "campaign_name": ["A", "B", "C"],
+            "spend": [10.0, None, 20.0],
+            "impressions": [100, 200, 300],
+            "clicks": [5, 15, 10],
+            "revenue": [50.0, 60.0, 70.0],
+        }
+    )
+    df.to_csv(csv_path, index=False)
+
+    in_memory = DataAgent(cfg={"data_csv": str(csv_path)}).load_and_summarize()
+    streamed = DataAgent(
+        cfg={
+            "data_csv": str(csv_path),
+            "streaming_threshold_bytes": 0,
+            "streaming_chunk_rows": 2,
+        }
+    ).load_and_summarize()
+
+    assert streamed["shape"] == in_memory["shape"]
+    for key, value in in_memory["totals"].items():
+        assert streamed["totals"][key] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("threshold", [None, 0])
+def test_data_agent_missing_column_raises_loader_error(tmp_path, threshold):
+    """
+    Schema errors surface as DataLoaderError whether the file is loaded
+    in memory or streamed.
+    """
+    csv_path = tmp_path / "sample_fb_ads_missing.csv"
+    pd.DataFrame(
+        {
+            "date": ["2025-01-01"],
+            "spend": [10.0],
+            "impressions": [100],
+            "clicks": [5],
+        }
+    ).to_csv(csv_path, index=False)
+
+    cfg = {"data_csv": str(csv_path)}
+    if threshold is not None:
+        cfg["streaming_threshold_bytes"] = threshold
+
+    with pytest.raises(DataLoaderError):
+        DataAgent(cfg=cfg).load_and_summarize()
+
+
+def test_data_agent_streaming_empty_file_raises_loader_error(tmp_path):
+    """A header-only file is rejected by the streaming path too."""
+    csv_path = tmp_path / "sample_fb_ads_empty.csv"
+    csv_path.write_text("date,campaign_name,spend,impressions,clicks,revenue\n")
+
+    cfg = {"data_csv": str(csv_path), "streaming_threshold_bytes": 0}
+    with pytest.raises(DataLoaderError):
+        DataAgent(cfg=cfg).load_and_summarize()
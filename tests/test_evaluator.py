@@ -45,3 +45,87 @@ def test_evaluator_runs_basic_validation():
 
     assert isinstance(result, list)
     assert len(result) == 1
+
+
+def test_evaluator_scores_batch_and_keeps_order():
+    """
+    Delta, impact tier and confidence are computed per hypothesis, and
+    hypotheses that cannot be scored keep their position in the output.
+    """
+    evaluator = Evaluator({})
+
+    hypotheses = [
+        {"hypothesis": "ctr fell", "metric": "ctr", "baseline": 0.02, "current": 0.013},
+        {"hypothesis": "no current", "metric": "roas", "baseline": 1.0},
+        {"hypothesis": "roas fell", "metric": "roas", "current": 1.5},
+        {"hypothesis": "flat", "metric": "other", "current": 3.0},
+    ]
+
+    result = evaluator.validate(hypotheses, {"overall_roas": 2.0})
+
+    assert [r["hypothesis"] for r in result] == [
+        "ctr fell",
+        "no current",
+        "roas fell",
+        "flat",
+    ]
+
+    assert result[0]["delta_pct"] == -35.0
+    assert result[0]["impact"] == "high"
+    assert result[0]["confidence"] == 0.7
+
+    assert "error" in result[1]
+    assert result[1]["impact"] == "unknown"
+
+    # Baseline falls back to summary["overall_roas"]
+    assert result[2]["baseline"] == 2.0
+    assert result[2]["impact"] == "medium"
+    assert result[2]["confidence"] == 0.5
+
+    # Baseline of 0 yields a zero delta rather than a division error
+    assert result[3]["delta_pct"] == 0.0
+    assert result[3]["impact"] == "low"
+
+
+def test_eval_kernels_numpy_and_loop_agree():
+    """The NumPy fallback and the (numba-compilable) loop give the same scores."""
+    import numpy as np
+
+    from src.agents._eval_kernels import _evaluate_loop, _evaluate_numpy
+
+    nan, inf = np.nan, np.inf
+    base = np.array([0.02, 2.0, 0.0, 1.0, 1.0, 1.0, 4.0, nan, 1.0, 1.0, inf, -inf])
+    curr = np.array([0.013, 1.5, 3.0, 1.15, 1.3, 1.31, 1.0, 1.0, nan, inf, 1.0, 1.0])
+
+    with np.errstate(invalid="ignore"):  # the un-jitted loop divides NumPy scalars
+        expected = _evaluate_loop(base, curr)
+    actual = _evaluate_numpy(base, curr)
+    for e, a in zip(expected, actual):
+        np.testing.assert_allclose(a, e)
+
+    # NaN deltas are "low" impact, an infinite delta is "high"
+    assert actual[2][7] == 0
+    assert actual[2][8] == 0
+    assert actual[2][9] == 2
+
+
+def test_eval_kernel_uses_jit_only_for_large_batches(monkeypatch):
+    """Small batches stay on the NumPy path; large ones go to the JIT kernel."""
+    import numpy as np
+
+    from src.agents import _eval_kernels
+
+    calls = []
+
+    def fake_jit(base, curr):
+        calls.append(base.size)
+        return _eval_kernels._evaluate_numpy(base, curr)
+
+    monkeypatch.setattr(_eval_kernels, "_jit_kernel", fake_jit)
+    monkeypatch.setattr(_eval_kernels, "JIT_MIN_BATCH", 10)
+
+    _eval_kernels.evaluate_kernel(np.ones(9), np.ones(9))
+    assert calls == []
+
+    _eval_kernels.evaluate_kernel(np.ones(10), np.ones(10))
+    assert calls == [10]
@@ -0,0 +1,97 @@
+from src.agents.insight_agent import InsightAgent
+
+
+def _ids(hypotheses):
+    return [h["hypothesis_id"] for h in hypotheses]
+
+
+def test_generate_hypotheses_detects_roas_drop_over_14_days():
+    """A fall in average daily ROAS (last 7 vs prior 7 days) is reported."""
+    agent = InsightAgent({"roas_drop_threshold_pct": 0.15})
+    dropping = [{"roas": 2.0}] * 7 + [{"roas": 1.0}] * 7
+
+    hypotheses = agent.generate_hypotheses({"daily": dropping})
+
+    assert hypotheses[0]["hypothesis_id"] == "h_roas_drop"
+    assert "50.00%" in hypotheses[0]["hypothesis"]
+    assert hypotheses[0]["expected_signals"] == [
+        "roas_down",
+        "revenue_down_or_spend_up",
+        "ctr_down",
+    ]
+
+    # Under the threshold, or with fewer than 14 days, there is no ROAS hypothesis
+    flat = [{"roas": 2.0}] * 7 + [{"roas": 1.9}] * 7
+    assert "h_roas_drop" not in _ids(agent.generate_hypotheses({"daily": flat}))
+    assert "h_roas_drop" not in _ids(agent.generate_hypotheses({"daily": dropping[1:]}))
+
+
+def test_generate_hypotheses_platforms_in_fixed_order():
+    """Platforms are found case-insensitively and listed instagram first."""
+    summary = {
+        "campaign": [
+            {"campaign_name": "Men Shoes FACEBOOK"},
+            {"campaign_name": None},
+            {"campaign_name": "Women instagram Reels"},
+        ]
+    }
+
+    hypotheses = InsightAgent({}).generate_hypotheses(summary)
+    platform = [h for h in hypotheses if h["hypothesis_id"] == "h_platform_specific"]
+
+    assert len(platform) == 1
+    assert platform[0]["hypothesis"].endswith("platform(s): instagram, facebook.")
+
+    no_platform = InsightAgent({}).generate_hypotheses(
+        {"campaign": [{"campaign_name": "Men Shoes"}]}
+    )
+    assert "h_platform_specific" not in _ids(no_platform)
+
+
+def test_generate_hypotheses_caps_low_ctr_campaigns_at_10():
+    """At most 10 creative hypotheses are produced, in campaign order."""
+    low_ctr = [{"campaign_name": f"C{i}", "ctr": 0.001} for i in range(12)]
+
+    hypotheses = InsightAgent({}).generate_hypotheses({"low_ctr_campaigns": low_ctr})
+    creative = [h for h in hypotheses if h["hypothesis_id"].startswith("h_creative_")]
+
+    assert _ids(creative) == [f"h_creative_{i}" for i in range(1, 11)]
+    assert "'C9'" in creative[-1]["hypothesis"]
+    assert "0.100%" in creative[0]["hypothesis"]
+    assert _ids(hypotheses) == (
+        _ids(creative) + ["h_audience_saturation", "h_data_quality"]
+    )
+
+
+def test_generate_hypotheses_static_entries_are_not_shared():
+    """Mutating one call's static hypotheses does not leak into the next."""
+    agent = InsightAgent({})
+
+    first = agent.generate_hypotheses({})
+    for h in first:
+        assert isinstance(h["expected_signals"], list)
+        h["expected_signals"].append("mutated")
+        h["confidence"] = 0.0
+
+    second = agent.generate_hypotheses({})
+    assert _ids(second) == ["h_audience_saturation", "h_data_quality"]
+    for h in second:
+        assert "mutated" not in h["expected_signals"]
+        assert h["confidence"] > 0
+
+
+def test_generate_hypotheses_json_matches_generate_hypotheses():
+    """The JSON variant serializes exactly what generate_hypotheses returns."""
+    import json
+
+    agent = InsightAgent({})
+    summary = {
+        "daily": [{"roas": 2.0}] * 7 + [{"roas": 1.0}] * 7,
+        "low_ctr_campaigns": [{"campaign_name": "C0", "ctr": 0.001}],
+        "campaign": [{"campaign_name": "facebook C0"}],
+    }
+
+    data = agent.generate_hypotheses_json(summary)
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == agent.generate_hypotheses(summary)
@@ -1,7 +1,9 @@
+import asyncio
+
 import pandas as pd
 import pytest
 
-from src.utils.loader import load_csv, DataLoaderError
+from src.utils.loader import load_csv, load_csvs_async, DataLoaderError
 
 
 def _make_minimal_df():
@@ -53,3 +55,289 @@ def test_load_csv_missing_required_column_raises(tmp_path):
                 "revenue",  # this one is missing -> should raise
             ],
         )
+
+
+def test_load_csv_pyarrow_engine_matches_pandas(tmp_path):
+    """The pyarrow engine returns the same data as the default reader."""
+    pytest.importorskip("pyarrow")
+
+    csv_path = tmp_path / "sample_arrow.csv"
+    df_in = _make_minimal_df()
+    df_in.to_csv(csv_path, index=False)
+
+    df_pandas = load_csv(str(csv_path), required_columns=df_in.columns)
+    df_arrow = load_csv(
+        str(csv_path),
+        required_columns=df_in.columns,
+        engine="pyarrow",
+    )
+
+    assert list(df_arrow.columns) == list(df_pandas.columns)
+    assert df_arrow["date"].dtype.kind == "M"
+    assert df_arrow["spend"].sum() == pytest.approx(df_pandas["spend"].sum())
+    assert df_arrow["clicks"].sum() == pytest.approx(df_pandas["clicks"].sum())
+
+
+def test_load_csv_dtype_map_same_on_both_engines(tmp_path):
+    """dtype_map gives the same dtypes and values with pyarrow and pandas."""
+    pytest.importorskip("pyarrow")
+
+    csv_path = tmp_path / "sample_dtype_map.csv"
+    df_in = pd.concat([_make_minimal_df()] * 2, ignore_index=True)
+    df_in["impressions"] = [100, None]
+    df_in.to_csv(csv_path, index=False)
+
+    dtype_map = {
+        "impressions": "Int64",
+        "campaign_name": "string",
+        "spend": "float32",
+        "revenue": "float",
+        "clicks": "int16",
+    }
+    frames = {
+        engine: load_csv(
+            str(csv_path),
+            required_columns=df_in.columns,
+            engine=engine,
+            dtype_map=dtype_map,
+        )
+        for engine in ("pandas", "pyarrow")
+    }
+
+    assert frames["pyarrow"]["impressions"].dtype == "Int64"
+    assert frames["pyarrow"]["revenue"].dtype == "float64"
+    pd.testing.assert_frame_equal(frames["pyarrow"], frames["pandas"])
+
+
+def test_load_csv_accepts_float_formatted_counts(tmp_path):
+    """Counts written as "100.0" load with every engine, like plain pandas."""
+    csv_path = tmp_path / "sample_float_counts.csv"
+    df_in = _make_minimal_df()
+    df_in["impressions"] = df_in["impressions"].astype(float)
+    df_in["clicks"] = df_in["clicks"].astype(float)
+    df_in.to_csv(csv_path, index=False)
+    assert "100.0" in csv_path.read_text()
+
+    from src.utils import loader
+
+    engines = ["pandas", "pyarrow"] if loader.HAS_PYARROW else ["pandas"]
+    for engine in engines:
+        df_out = load_csv(
+            str(csv_path),
+            required_columns=df_in.columns,
+            engine=engine,
+        )
+        assert df_out["impressions"].iloc[0] == 100
+        assert df_out["clicks"].iloc[0] == 5
+
+
+def test_load_csv_compacts_dtypes_unless_disabled(tmp_path):
+    """campaign_name is categorical and counts are downcast by default."""
+    csv_path = tmp_path / "sample_compact.csv"
+    df_in = _make_minimal_df()
+    df_in.to_csv(csv_path, index=False)
+
+    df_out = load_csv(str(csv_path), required_columns=df_in.columns)
+    assert isinstance(df_out["campaign_name"].dtype, pd.CategoricalDtype)
+    assert df_out["impressions"].dtype == "int32"
+    assert df_out["spend"].dtype == "float64"
+
+    df_raw = load_csv(
+        str(csv_path),
+        required_columns=df_in.columns,
+        compact_dtypes=False,
+    )
+    assert df_raw["campaign_name"].dtype == object
+    assert df_raw["impressions"].dtype == "int64"
+
+
+def test_load_csv_compacted_counts_keep_arithmetic(tmp_path):
+    """Compacted count columns can be subtracted and scaled without wrapping."""
+    csv_path = tmp_path / "sample_compact_math.csv"
+    df_in = _make_minimal_df()
+    df_in["impressions"] = [100]
+    df_in["clicks"] = [5.0]
+    df_in.to_csv(csv_path, index=False)
+
+    df_out = load_csv(str(csv_path), required_columns=df_in.columns)
+
+    assert df_out["clicks"].dtype.kind == "i"
+    assert (df_out["clicks"] - df_out["impressions"]).iloc[0] == -95
+    assert (df_out["impressions"] + 200).iloc[0] == 300
+    assert (df_out["impressions"] * 1000).iloc[0] == 100_000
+
+
+def test_load_csv_cache_returns_copies_and_tracks_mtime(tmp_path):
+    """Repeat loads are independent copies; a rewritten file is re-read."""
+    import os
+
+    csv_path = tmp_path / "sample_cached.csv"
+    df_in = _make_minimal_df()
+    df_in.to_csv(csv_path, index=False)
+
+    first = load_csv(str(csv_path), required_columns=df_in.columns)
+    first.loc[0, "spend"] = -1.0
+
+    second = load_csv(str(csv_path), required_columns=df_in.columns)
+    assert second.loc[0, "spend"] == 10.0
+
+    df_in["spend"] = [99.0]
+    df_in.to_csv(csv_path, index=False)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = load_csv(str(csv_path), required_columns=df_in.columns)
+    assert third.loc[0, "spend"] == 99.0
+
+
+def test_load_csv_cache_detects_rewrite_with_preserved_mtime(tmp_path):
+    """A rewrite that keeps the old mtime (cp -p, rsync -t) is still re-read."""
+    import os
+
+    csv_path = tmp_path / "sample_cached_mtime.csv"
+    df_in = _make_minimal_df()
+    df_in["spend"] = [1.0]
+    df_in.to_csv(csv_path, index=False)
+    stat = os.stat(csv_path)
+
+    first = load_csv(str(csv_path), required_columns=df_in.columns)
+    assert first.loc[0, "spend"] == 1.0
+
+    df_in["spend"] = [999.0]
+    df_in.to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = load_csv(str(csv_path), required_columns=df_in.columns)
+    assert second.loc[0, "spend"] == 999.0
+
+
+def test_load_csv_without_cache_always_parses(tmp_path, monkeypatch):
+    """use_cache=False neither reads from nor fills the frame cache."""
+    from src.utils import loader
+
+    csv_path = tmp_path / "sample_uncached.csv"
+    df_in = _make_minimal_df()
+    df_in.to_csv(csv_path, index=False)
+
+    loader._load_csv_cached.cache_clear()
+    calls = []
+    real_read_csv = loader.pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs.get("nrows"))
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(loader.pd, "read_csv", counting_read_csv)
+
+    for _ in range(2):
+        df_out = load_csv(
+            str(csv_path),
+            required_columns=df_in.columns,
+            engine="pandas",
+            use_cache=False,
+        )
+        assert df_out.loc[0, "spend"] == 10.0
+
+    # header probe + full read, twice
+    assert calls == [0, None, 0, None]
+    assert loader._load_csv_cached.cache_info().currsize == 0
+
+
+def test_load_csv_retries_transient_io_errors_only(tmp_path, monkeypatch):
+    """OSError is retried with backoff; schema errors fail without sleeping."""
+    import src.utils.loader as loader
+
+    sleeps = []
+    monkeypatch.setattr(loader.time, "sleep", sleeps.append)
+
+    csv_path = tmp_path / "sample_flaky.csv"
+    df_in = _make_minimal_df()
+    df_in.to_csv(csv_path, index=False)
+
+    real_read_csv = loader.pd.read_csv
+    calls = {"n": 0}
+
+    def flaky_read_csv(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise OSError("temporary I/O failure")
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(loader.pd, "read_csv", flaky_read_csv)
+
+    df_out = load_csv(str(csv_path), required_columns=df_in.columns, engine="pandas")
+    assert len(df_out) == 1
+    # the first read failed, the second attempt succeeded after one backoff
+    assert len(sleeps) == 1
+
+    with pytest.raises(DataLoaderError):
+        load_csv(
+            str(csv_path),
+            required_columns=["date", "not_a_column"],
+            engine="pandas",
+        )
+    assert len(sleeps) == 1
+
+
+def test_load_csvs_async_matches_sync_and_keeps_order(tmp_path):
+    """Concurrent loads return the same frames as load_csv, in input order."""
+    paths = []
+    for i in range(3):
+        csv_path = tmp_path / f"tenant_{i}.csv"
+        df_in = _make_minimal_df()
+        df_in["spend"] = [10.0 * (i + 1)]
+        df_in.to_csv(csv_path, index=False)
+        paths.append(str(csv_path))
+
+    frames = asyncio.run(load_csvs_async(paths, engine="pandas"))
+
+    assert [df["spend"].iloc[0] for df in frames] == [10.0, 20.0, 30.0]
+    for path, df in zip(paths, frames):
+        pd.testing.assert_frame_equal(df, load_csv(path, engine="pandas"))
+
+
+def test_load_csv_does_not_retry_permanent_io_errors(tmp_path, monkeypatch):
+    """A directory path fails at once instead of backing off."""
+    from src.utils import loader
+
+    sleeps = []
+    monkeypatch.setattr(loader.time, "sleep", sleeps.append)
+
+    with pytest.raises(IsADirectoryError):
+        load_csv(str(tmp_path), engine="pandas")
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    "dates", [["2025-01-31", "2025-02-01"], ["01/31/2025", "02/01/2025"]]
+)
+def test_load_csv_parses_each_date_format(tmp_path, caplog, dates):
+    """Both DATE_FORMATS are detected and parsed without losing rows."""
+    csv_path = tmp_path / "sample_dates.csv"
+    df_in = pd.concat([_make_minimal_df()] * 2, ignore_index=True)
+    df_in["date"] = dates
+    df_in.to_csv(csv_path, index=False)
+
+    with caplog.at_level("WARNING", logger="src.utils.loader"):
+        df_out = load_csv(str(csv_path), required_columns=df_in.columns)
+
+    assert df_out["date"].tolist() == [
+        pd.Timestamp("2025-01-31"),
+        pd.Timestamp("2025-02-01"),
+    ]
+    assert "set to NaT" not in caplog.text
+
+
+def test_load_csv_warns_about_unparseable_dates(tmp_path, caplog):
+    """Dates that do not match the probed format become NaT with a warning."""
+    csv_path = tmp_path / "sample_bad_dates.csv"
+    df_in = pd.concat([_make_minimal_df()] * 4, ignore_index=True)
+    df_in["date"] = ["2025-01-31", "not a date", "02/01/2025", None]
+    df_in.to_csv(csv_path, index=False)
+
+    with caplog.at_level("WARNING", logger="src.utils.loader"):
+        df_out = load_csv(str(csv_path), required_columns=df_in.columns)
+
+    assert df_out["date"].isna().tolist() == [False, True, True, True]
+    # The originally empty value is not counted as coerced
+    assert "2 date value(s) did not match format %Y-%m-%d" in caplog.text
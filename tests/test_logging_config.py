@@ -0,0 +1,51 @@
+import logging
+import re
+from pathlib import Path
+
+from src.utils import logging_config
+from src.utils.logging_config import setup_logging
+
+LINE_RE = re.compile(r"^\d{2}:\d{2}:\d{2}Z \| test_logging \| (\w+) \| (.*)$")
+
+
+def test_setup_logging_twice_keeps_every_record(tmp_path, monkeypatch):
+    """
+    Records logged before and after a second setup_logging() call all reach
+    the log file(s) in the "HH:MM:SSZ | name | LEVEL | msg" format once the
+    background listener is stopped.
+    """
+    monkeypatch.chdir(tmp_path)
+    # setup_logging changes process-wide logging state; restore it afterwards
+    for attr in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, attr, getattr(logging, attr))
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+
+    logger = logging.getLogger("test_logging")
+    try:
+        first_path = setup_logging()
+        logger.info("before second setup")
+        logger.debug("below the INFO level")
+
+        second_path = setup_logging()
+        logger.warning("after second setup")
+        logging_config._stop_listener()
+    finally:
+        logging_config._stop_listener()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    assert first_path.parent == second_path.parent == Path("logs")
+    assert (tmp_path / second_path).exists()
+    log_files = sorted((tmp_path / "logs").glob("run_*.log"))
+
+    records = [
+        LINE_RE.match(line).groups()
+        for path in log_files
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if "| test_logging |" in line
+    ]
+    assert records == [
+        ("INFO", "before second setup"),
+        ("WARNING", "after second setup"),
+    ]
@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.utils import serialization
+from src.utils.serialization import to_json_bytes
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_to_json_bytes_handles_numpy_nan_and_non_str_keys(backend):
+    """Both backends produce the same valid JSON for awkward values."""
+    payload = {
+        "ratio": np.float64(1.5),
+        "count": np.int64(3),
+        "missing": float("nan"),
+        "unbounded": np.float64("inf"),
+        "series": np.array([1.0, np.nan]),
+        "signals": ("low_ctr", "low_clicks"),
+        7: "int key",
+        "text": "Don’t Miss Out",
+    }
+
+    data = to_json_bytes(payload)
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {
+        "ratio": 1.5,
+        "count": 3,
+        "missing": None,
+        "unbounded": None,
+        "series": [1.0, None],
+        "signals": ["low_ctr", "low_clicks"],
+        "7": "int key",
+        "text": "Don’t Miss Out",
+    }
+    # UTF-8 text is written as-is, not \u-escaped
+    assert "Don’t".encode("utf-8") in data
+
+
+def test_to_json_bytes_indent(backend):
+    """indent=True writes two-space indented JSON."""
+    data = to_json_bytes({"a": [1]}, indent=True)
+
+    assert data.decode("utf-8").splitlines() == ["{", '  "a": [', "    1", "  ]", "}"]